@@ -126,14 +126,14 @@ class NotionCRUDEngineV2:
             # 1. Add user message to history
             self.context_manager.store_string(command.prompt, "user")
 
+            # 2. Get available tools (built once before the loop)
+            tools = await self.tool_manager.get_tools()
+
             # Loop for potential tool execution cycles
             while True:
-                # 2. Get current context (including latest user message or tool results)
+                # 3. Get current context (including latest user message or tool results)
                 current_context = self.context_manager.retrieve()
 
-                # 3. Get available tools
-                tools = await self.tool_manager.get_tools()
-
                 # 4. Call LLM
                 await self.message_bus.publish(
                     NotionCRUDEngineStatusEvent(
@@ -168,11 +168,12 @@ class FactProcessingEngine(Engine):
 
         self.context_manager.store_string(content, "user")
 
+        # Get the tools (built once before the loop)
+        tools = await self.tool_manager.get_tools()
+
         while True:
             # Retrieve the current context
             current_context = await self.context_manager.retrieve()
-            # Get the tools
-            tools = await self.tool_manager.get_tools()
             # Notify status
             await self.message_bus.publish(
                 FactProcessingEngineStatusEvent(
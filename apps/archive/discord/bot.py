@@ -13,6 +13,7 @@ import asyncio
 import logging
 
 import discord
+from darcy.notion_crud_engine_v3 import NotionCRUDEnginePromptCommand
 from discord.ext import commands
 from llmgine.bootstrap import ApplicationBootstrap
 from llmgine.bus.bus import MessageBus
@@ -24,6 +25,7 @@ from session_manager import SessionManager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 
 class DarcyBot:
@@ -46,6 +48,9 @@ class DarcyBot:
             self.config, self.session_manager
         )
 
+        # Mentions being handled in the background, kept referenced until done
+        self._mention_tasks: set[asyncio.Task[None]] = set()
+
         # Set up event handlers
         self.bot.event(self.on_ready)
         self.bot.event(self.on_message)
@@ -64,33 +69,44 @@ class DarcyBot:
 
         assert self.bot.user is not None
         if self.bot.user.mentioned_in(message):
-            # Process the message
-            (
-                processed_message,
-                session_id,
-            ) = await self.message_processor.process_mention(message)
-
-            # Create command and use engine
-            from darcy.notion_crud_engine_v3 import NotionCRUDEnginePromptCommand
-
-            command = NotionCRUDEnginePromptCommand(prompt=processed_message.content)
-            result = await self.engine_manager.use_engine(command, session_id)
-
-            # Send response
-            if result.result:
-                await message.reply(
-                    f"{result.result[: self.config.max_response_length]}"
-                )
-            else:
-                await message.reply(
-                    "❌ An error occurred. Sorry about that, please forgive me!!"
-                )
-
-            # Complete the session
-            await self.session_manager.complete_session(session_id, "Session completed")
+            # Run the engine in the background so this handler returns immediately
+            task = asyncio.create_task(self._handle_mention(message))
+            self._mention_tasks.add(task)
+            task.add_done_callback(self._on_mention_done)
 
         await self.bot.process_commands(message)
 
+    async def _handle_mention(self, message: discord.Message) -> None:
+        """Run a mention through the engine and reply with the result."""
+        # Process the message
+        (
+            processed_message,
+            session_id,
+        ) = await self.message_processor.process_mention(message)
+
+        # Create command and use engine
+        command = NotionCRUDEnginePromptCommand(prompt=processed_message.content)
+        result = await self.engine_manager.use_engine(command, session_id)
+
+        # Send response
+        if result.result:
+            await message.reply(
+                f"{result.result[: self.config.max_response_length]}"
+            )
+        else:
+            await message.reply(
+                "❌ An error occurred. Sorry about that, please forgive me!!"
+            )
+
+        # Complete the session
+        await self.session_manager.complete_session(session_id, "Session completed")
+
+    def _on_mention_done(self, task: asyncio.Task[None]) -> None:
+        """Release a finished mention task and log its failure, if any."""
+        self._mention_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Error handling mention", exc_info=task.exception())
+
     async def start(self):
         """Start the bot and all necessary services."""
         # Bootstrap the application
@@ -15,6 +15,11 @@ import logging
 import discord
 from discord.ext import commands
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
 from .config import DiscordBotConfig
 from .message_processor import MessageProcessor
 from .session_manager import SessionManager
@@ -116,4 +121,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
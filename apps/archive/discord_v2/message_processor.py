@@ -8,6 +8,7 @@ It processes:
 - reactions
 """
 
+import asyncio
 import logging
 from typing import Optional, List, Dict, Any
 
@@ -43,7 +44,8 @@ class MessageProcessor:
 
         # Process user mentions
         user_mentions = self._process_mentions(message)
-        author_payload = self._create_author_payload(message)
+        # The author lookup queries Postgres synchronously, keep it off the event loop
+        author_payload = await asyncio.to_thread(self._create_author_payload, message)
         chat_history = await self._get_chat_history(message)
         reply_payload = await self._process_reply(message)
 
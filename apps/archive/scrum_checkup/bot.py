@@ -9,7 +9,11 @@ Components include:
 The bot is started here.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
 import threading
 from datetime import datetime, timedelta
 
@@ -34,6 +38,10 @@ from components import YesNoView
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+# Hash of the last command tree pushed to Discord, used to skip redundant syncs
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+COMMAND_TREE_HASH_PATH = os.path.join(SCRIPT_DIR, ".command_tree_hash")
+
 
 class ScrumMasterBot:
     _instance = None
@@ -49,32 +57,39 @@ class ScrumMasterBot:
 
     def __init__(self) -> None:
         # Only initialize once
-        if hasattr(self, "_initialized"):
+        if getattr(self, "_initialized", False):
             return
 
-        # Load configuration
-        self.config = DiscordBotConfig.load_from_env()
+        # Double-check under the lock so concurrent callers can't both build the bot
+        with type(self)._lock:
+            if getattr(self, "_initialized", False):
+                return
+
+            # Load configuration
+            self.config = DiscordBotConfig.load_from_env()
 
-        # Initialize Discord bot
-        intents: discord.Intents = discord.Intents.default()
-        intents.message_content = True
-        intents.messages = True
-        self.bot: commands.Bot = commands.Bot(command_prefix="!", intents=intents)
+            # Initialize Discord bot
+            intents: discord.Intents = discord.Intents.default()
+            intents.message_content = True
+            intents.messages = True
+            self.bot: commands.Bot = commands.Bot(command_prefix="!", intents=intents)
 
-        # Initialize managers
-        self.channel_register: dict[
-            DiscordChannelID, tuple[ScrumMasterEngine, CheckUpEventContext]
-        ] = {}
+            # Initialize managers
+            self.channel_register: dict[
+                DiscordChannelID, tuple[ScrumMasterEngine, CheckUpEventContext]
+            ] = {}
+            # Event loop time of the last message in each checkup channel
+            self.channel_activity: dict[DiscordChannelID, float] = {}
 
-        # Set up event handlers
-        self.bot.event(self.on_message)
-        self.bot.event(self.on_ready)
+            # Set up event handlers
+            self.bot.event(self.on_message)
+            self.bot.event(self.on_ready)
 
-        # Add slash command
-        self.setup_slash_commands()
+            # Add slash command
+            self.setup_slash_commands()
 
-        # Mark as initialized
-        self._initialized = True
+            # Mark as initialized
+            self._initialized = True
 
     def setup_slash_commands(self) -> None:
         """Set up slash commands for the bot."""
@@ -121,6 +136,15 @@ class ScrumMasterBot:
             engine,
             checkup_context,
         )
+        self.channel_activity[checkup_context.checkup_channel_id] = self.bot.loop.time()
+        # Drop the checkup once it has been idle for the timeout, so engines don't pile up
+        self.bot.loop.create_task(
+            self._expire_session(
+                checkup_context.checkup_channel_id,
+                self.config.checkup_timeout_minutes,
+                engine,
+            )
+        )
         await engine.tool_manager.register_tool(request_end_conversation)
         MessageBus().register_command_handler(
             ScrumMasterConfirmEndConversationCommand,
@@ -143,25 +167,64 @@ class ScrumMasterBot:
         )
 
     async def end_session(self, channel_id: DiscordChannelID) -> None:
+        # Unregister first so a concurrent end or expiry can't finish the session twice
+        entry = self.channel_register.pop(channel_id, None)
+        if entry is None:
+            print(f"No active session for channel {channel_id}")
+            return
+        self.channel_activity.pop(channel_id, None)
         print(f"Ending session for channel {channel_id}")
-        conversation = await self.channel_register[channel_id][0].extract_conversation()
-        self.channel_register[channel_id][1].conversation = conversation # type: ignore
-        await MessageBus().publish(
-            CheckUpFinishedEvent(checkup_context=self.channel_register[channel_id][1])
-        )
-        self.channel_register.pop(channel_id)
+        engine, checkup_context = entry
+        conversation = await engine.extract_conversation()
+        checkup_context.conversation = conversation # type: ignore
+        await MessageBus().publish(CheckUpFinishedEvent(checkup_context=checkup_context))
+
+    async def _expire_session(
+        self, channel_id: DiscordChannelID, minutes: int, engine: ScrumMasterEngine
+    ) -> None:
+        """Background task to drop a checkup session after a period of inactivity"""
+        timeout = minutes * 60  # Convert to seconds
+        while True:
+            # Stop if the session ended, or the channel now holds a newer session
+            entry = self.channel_register.get(channel_id)
+            if entry is None or entry[0] is not engine:
+                return
+            idle = self.bot.loop.time() - self.channel_activity.get(channel_id, 0.0)
+            if idle >= timeout:
+                break
+            await asyncio.sleep(timeout - idle)
+
+        # An unanswered checkup is discarded, not finished, so nothing is recorded
+        # or updated from an empty conversation
+        self.channel_register.pop(channel_id, None)
+        self.channel_activity.pop(channel_id, None)
+        print(f"Session for channel {channel_id} expired after {minutes} minutes")
+        channel = self.bot.get_channel(int(channel_id))
+        if channel is not None:
+            await channel.send(  # type: ignore
+                f"⏱️ Scrum checkup timed out after {minutes} minutes of inactivity"
+            )
 
     async def on_ready(self) -> None:
         """Called when the bot is ready and connected to Discord."""
         print(f"Bot is ready! Logged in as {self.bot.user}")
         # Now the bot can access channels
 
-        # Sync slash commands
-        try:
-            synced = await self.bot.tree.sync()
-            print(f"Synced {len(synced)} command(s)")
-        except Exception as e:
-            print(f"Failed to sync commands: {e}")
+        # Sync slash commands, only when they changed since the last sync
+        tree_hash = self._command_tree_hash()
+        if tree_hash == await asyncio.to_thread(self._read_synced_tree_hash):
+            print("Command tree unchanged, skipping sync")
+        else:
+            try:
+                synced = await self.bot.tree.sync()
+                print(f"Synced {len(synced)} command(s)")
+            except Exception as e:
+                print(f"Failed to sync commands: {e}")
+            else:
+                try:
+                    await asyncio.to_thread(self._write_synced_tree_hash, tree_hash)
+                except OSError as e:
+                    print(f"Failed to record synced command tree hash: {e}")
 
         # print(f"\n\nScrumMasterBot instance on_ready: {self.get_instance()}\n\n")
         # await MessageBus().publish(
@@ -171,6 +234,28 @@ class ScrumMasterBot:
         #     )
         # )
 
+    def _command_tree_hash(self) -> str:
+        """Hash the payload tree.sync() would send for the logged in application."""
+        payload = [
+            command.to_dict(self.bot.tree) for command in self.bot.tree.get_commands()
+        ]
+        application_id = self.bot.user.id if self.bot.user else None
+        signature = json.dumps([application_id, payload], sort_keys=True)
+        return hashlib.blake2b(signature.encode(), digest_size=16).hexdigest()
+
+    def _read_synced_tree_hash(self) -> str | None:
+        """Read the hash of the last successfully synced command tree."""
+        try:
+            with open(COMMAND_TREE_HASH_PATH) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _write_synced_tree_hash(self, tree_hash: str) -> None:
+        """Record the hash of a successfully synced command tree."""
+        with open(COMMAND_TREE_HASH_PATH, "w") as f:
+            f.write(tree_hash)
+
     async def on_message(self, message: discord.Message) -> None:
         """Handle incoming messages."""
         if message.author == self.bot.user:
@@ -179,13 +264,14 @@ class ScrumMasterBot:
         if message.mention_everyone:
             return
 
-        if str(message.channel.id) in self.channel_register.keys():
-            async with self.show_loading_message(
-                DiscordChannelID(str(message.channel.id)), message
-            ):
-                response = await self.channel_register[
-                    DiscordChannelID(str(message.channel.id))
-                ][0].handle_command(ScrumMasterCommand(prompt=message.content))
+        channel_id = DiscordChannelID(str(message.channel.id))
+        entry = self.channel_register.get(channel_id)
+        if entry is not None:
+            self.channel_activity[channel_id] = self.bot.loop.time()
+            async with self.show_loading_message(channel_id, message):
+                response = await entry[0].handle_command(
+                    ScrumMasterCommand(prompt=message.content)
+                )
             await message.reply(response.result)
         else:
             print("Message received in unregistered channel")
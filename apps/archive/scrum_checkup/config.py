@@ -8,6 +8,7 @@ This module contains the configuration for Darcy:
 - Maximum response length
 - Discord bot key
 - Bot ID
+- Checkup session timeout
 
 It also loads Darcy's key from the environment variables.
 """
@@ -37,6 +38,9 @@ class DiscordBotConfig(ApplicationConfig):
     bot_key: str = ""
     bot_id: str = ""
     guild_id: str = ""
+
+    # Checkup sessions idle for this many minutes are dropped
+    checkup_timeout_minutes: int = 60
     
     @classmethod
     def load_from_env(cls) -> "DiscordBotConfig":
@@ -96,9 +96,9 @@ class ScrumMasterEngine:
             role="user",
         )
         try:
+            tools = await self.tool_manager.get_tools()
             while True:
                 current_context = await self.context_manager.retrieve()
-                tools = await self.tool_manager.get_tools()
                 await self.bus.publish(
                     ScrumMasterEngineStatusEvent(
                         status="Calling LLM",
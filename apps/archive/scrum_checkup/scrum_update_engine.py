@@ -85,9 +85,9 @@ class ScrumUpdateEngine:
             role="user",
         )
         try:
+            tools = await self.tool_manager.get_tools()
             while True:
                 current_context = await self.context_manager.retrieve()
-                tools = await self.tool_manager.get_tools()
                 await self.bus.publish(
                     ScrumUpdateEngineStatusEvent(
                         status="Calling LLM",
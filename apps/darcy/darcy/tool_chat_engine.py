@@ -152,8 +152,9 @@ class DarcyToolChatEngine:
                     for tc in message.tool_calls
                 ]
 
-                # Confirm and execute tools one by one via Discord prompt
+                # Confirm tools one by one via Discord prompt
                 tool_results = []
+                approved = []
                 for tc in tool_calls:
                     confirm_cmd = PromptRequestCommand(
                         session_id=self.session_id,
@@ -166,9 +167,24 @@ class DarcyToolChatEngine:
                     if not proceed:
                         tool_results.append(f"Error: Tool '{tc.name}' was denied by user")
                         continue
-                    [exec_result] = await self.tool_manager.execute_tool_calls([tc])
-                    tool_results.append(exec_result)
-                    print(f"Tool '{tc.name}' executed with result: {exec_result}")
+                    # Placeholder filled in once the approved tools have run
+                    approved.append((len(tool_results), tc))
+                    tool_results.append(None)
+
+                # Execute the approved tools concurrently, keeping the call order
+                exec_results = await asyncio.gather(
+                    *(self.tool_manager.execute_tool_calls([tc]) for _, tc in approved),
+                    return_exceptions=True,
+                )
+                for (index, tc), exec_result in zip(approved, exec_results):
+                    if isinstance(exec_result, Exception):
+                        tool_results[index] = f"Error: Tool '{tc.name}' failed: {exec_result}"
+                    elif isinstance(exec_result, BaseException):
+                        # Cancellation and interpreter exits are not tool failures
+                        raise exec_result
+                    else:
+                        [tool_results[index]] = exec_result
+                    print(f"Tool '{tc.name}' executed with result: {tool_results[index]}")
 
                 # Add assistant message with tool calls
                 self.chat.add_assistant_message(content=message.content or "", tool_calls=tool_calls)
@@ -1,4 +1,6 @@
+import logging
 import os
+import threading
 from datetime import datetime, timedelta
 from typing import Any, Optional
 from pathlib import Path
@@ -7,75 +9,97 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseEngine:
     _engine: Optional[Engine] = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_engine(cls) -> Engine:
         if cls._engine is None:
-            # Load environment and create engine
-            project_root = Path(__file__).parent.parent.parent
-            env_path = project_root / ".env"
-            load_dotenv(dotenv_path=env_path, override=True)
-            database_url = os.getenv("DATABASE_URL")
-            if not database_url:
-                raise ValueError("DATABASE_URL is not set.")
-            cls._engine = create_engine(database_url)
+            # Callers run in worker threads, only one of them may build the engine
+            with cls._lock:
+                # Double-check locking pattern
+                if cls._engine is None:
+                    # Load environment and create engine
+                    project_root = Path(__file__).parent.parent.parent
+                    env_path = project_root / ".env"
+                    load_dotenv(dotenv_path=env_path, override=True)
+                    database_url = os.getenv("DATABASE_URL")
+                    if not database_url:
+                        raise ValueError("DATABASE_URL is not set.")
+                    cls._engine = create_engine(database_url)
         return cls._engine
 
 
+_SQL_GET_USER = text("""
+    SELECT *
+    FROM gold.users_base
+    WHERE discord_id = :discord_id
+    LIMIT 1
+""")
+
+
 def get_user(discord_id: str) -> Optional[dict[str, Any]]:
     engine = DatabaseEngine.get_engine()
-    query = text("""
-        SELECT *
-        FROM gold.users_base
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
     with engine.connect() as conn:
-        result = conn.execute(query, {"discord_id": discord_id})
+        result = conn.execute(_SQL_GET_USER, {"discord_id": discord_id})
         user = result.mappings().first()
         return dict(user) if user else None
 
 
+_SQL_GET_USER_FACTS = text("""
+    SELECT f.*
+    FROM gold.all_facts f
+    JOIN gold.users_base u ON f.user_name = u.name
+    WHERE u.discord_id = :discord_id
+      AND f.created_at >= :days_ago
+    ORDER BY f.created_at DESC
+""")
+
+
 def get_user_fact(discord_id: str, days_back: int = 30) -> list[dict[str, Any]]:
     engine = DatabaseEngine.get_engine()
     days_ago = datetime.now() - timedelta(days=days_back)
-    query = text("""
-        SELECT f.*
-        FROM gold.all_facts f
-        JOIN gold.users_base u ON f.user_name = u.name
-        WHERE u.discord_id = :discord_id
-          AND f.created_at >= :days_ago
-        ORDER BY f.created_at DESC
-    """)
     with engine.connect() as conn:
-        result = conn.execute(query, {"discord_id": discord_id, "days_ago": days_ago})
+        result = conn.execute(
+            _SQL_GET_USER_FACTS, {"discord_id": discord_id, "days_ago": days_ago}
+        )
         facts = result.mappings().all()
         return [dict(fact) for fact in facts]
 
 
+_SQL_INSERT_USER_FACT = text("""
+    INSERT INTO silver.fact (user_id, fact_text)
+    SELECT id, :fact_text
+    FROM silver.user
+    WHERE discord_id = :discord_id
+    LIMIT 1
+    RETURNING user_id
+""")
+
+
 def set_user_fact(discord_id: str, fact_text: str) -> None:
     engine = DatabaseEngine.get_engine()
-    user_query = text("""
-        SELECT id
-        FROM silver.user
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
+    # Resolve the user and insert the fact in a single round-trip
     with engine.begin() as conn:
-        user_result = conn.execute(user_query, {"discord_id": discord_id})
-        user = user_result.fetchone()
-        if not user:
+        result = conn.execute(
+            _SQL_INSERT_USER_FACT, {"discord_id": discord_id, "fact_text": fact_text}
+        )
+        if not result.fetchone():
             raise ValueError(f"No user found with discord_id {discord_id}")
-        user_id = user.id
-        insert_query = text("""
-            INSERT INTO silver.fact (user_id, fact_text)
-            VALUES (:user_id, :fact_text)
-        """)
-        conn.execute(insert_query, {"user_id": user_id, "fact_text": fact_text})
-        print(f"✅ Inserted fact for user {discord_id}")
+        logger.info(f"Inserted fact for user {discord_id}")
+
+
+_SQL_GET_USER_FACTS_WITH_KEYWORDS = text("""
+    SELECT f.*
+    FROM gold.all_facts f
+    JOIN gold.users_base u ON f.user_name = u.name
+    WHERE u.discord_id = :discord_id AND f.fact_text LIKE ANY(:keywords)
+    ORDER BY f.created_at DESC
+""")
 
 
 def get_user_facts_with_keywords(
@@ -83,41 +107,62 @@ def get_user_facts_with_keywords(
 ) -> list[dict[str, Any]]:
     engine = DatabaseEngine.get_engine()
     processed_keywords = [f"%{keyword}%" for keyword in keywords]
-    query = text("""
-        SELECT f.*
-        FROM gold.all_facts f
-        JOIN gold.users_base u ON f.user_name = u.name
-        WHERE u.discord_id = :discord_id AND f.fact_text LIKE ANY(:keywords)
-        ORDER BY f.created_at DESC
-    """)
     with engine.connect() as conn:
         result = conn.execute(
-            query, {"discord_id": discord_id, "keywords": processed_keywords}
+            _SQL_GET_USER_FACTS_WITH_KEYWORDS,
+            {"discord_id": discord_id, "keywords": processed_keywords},
         )
         facts = result.mappings().all()
         return [dict(fact) for fact in facts]
 
 
-def delete_fact(discord_id: str, fact_id: str) -> None:
-    engine = DatabaseEngine.get_engine()
-    user_query = text("""
+_SQL_DELETE_USER_FACT = text("""
+    WITH target_user AS (
         SELECT id
         FROM silver.user
         WHERE discord_id = :discord_id
         LIMIT 1
-    """)
+    ), deleted AS (
+        DELETE FROM silver.fact
+        WHERE fact_id = :fact_id
+          AND user_id = (SELECT id FROM target_user)
+    )
+    SELECT id FROM target_user
+""")
+
+
+def delete_fact(discord_id: str, fact_id: str) -> None:
+    engine = DatabaseEngine.get_engine()
+    # Resolve the user and delete the fact in a single round-trip,
+    # still returning the user so a missing user can be reported
     with engine.begin() as conn:
-        user_result = conn.execute(user_query, {"discord_id": discord_id})
-        user = user_result.fetchone()
-        if not user:
+        result = conn.execute(
+            _SQL_DELETE_USER_FACT, {"discord_id": discord_id, "fact_id": int(fact_id)}
+        )
+        if not result.fetchone():
             raise ValueError(f"No user found with discord_id {discord_id}")
-        user_id = user.id
-        delete_query = text("""
-            DELETE FROM silver.fact
-            WHERE fact_id = :fact_id AND user_id = :user_id
-        """)
-        conn.execute(delete_query, {"user_id": user_id, "fact_id": int(fact_id)})
-        print(f"✅ Deleted fact for user {discord_id}")
+        logger.info(f"Deleted fact for user {discord_id}")
+
+
+_SQL_INIT_COMMITTEE_CHECKUPS = text("""
+    INSERT INTO silver.committee_personal_checkup 
+    (member_id, committee_name, personal_description, checkup_text, start_date, end_date, is_current)
+    SELECT 
+        c.member_id,
+        c.name,
+        NULL,
+        NULL,
+        CURRENT_TIMESTAMP,
+        '9999-12-31',
+        TRUE
+    FROM silver.committee c
+    WHERE NOT EXISTS (
+        SELECT 1 
+        FROM silver.committee_personal_checkup cpc 
+        WHERE cpc.member_id = c.member_id 
+        AND cpc.is_current = TRUE
+    )
+""")
 
 
 def set_initial_committee_personal_checkup() -> None:
@@ -129,33 +174,41 @@ def set_initial_committee_personal_checkup() -> None:
     engine = DatabaseEngine.get_engine()
 
     # Query to find committee members who don't have active checkup records
-    query = text("""
-        INSERT INTO silver.committee_personal_checkup 
-        (member_id, committee_name, personal_description, checkup_text, start_date, end_date, is_current)
-        SELECT 
-            c.member_id,
-            c.name,
-            NULL,
-            NULL,
-            CURRENT_TIMESTAMP,
-            '9999-12-31',
-            TRUE
-        FROM silver.committee c
-        WHERE NOT EXISTS (
-            SELECT 1 
-            FROM silver.committee_personal_checkup cpc 
-            WHERE cpc.member_id = c.member_id 
-            AND cpc.is_current = TRUE
-        )
-    """)
-
     with engine.begin() as conn:
-        result = conn.execute(query)
+        result = conn.execute(_SQL_INIT_COMMITTEE_CHECKUPS)
         inserted_count = result.rowcount
-        print(f"✅ Initialized {inserted_count} committee personal checkup records")
+        logger.info(f"Initialized {inserted_count} committee personal checkup records")
 
         if inserted_count == 0:
-            print("ℹ️  All committee members already have active checkup records")
+            logger.info("All committee members already have active checkup records")
+
+
+_SQL_GET_COMMITTEE_MEMBER_ID = text("""
+    SELECT member_id, name
+    FROM silver.committee
+    WHERE discord_id = :discord_id
+    LIMIT 1
+""")
+
+_SQL_END_CURRENT_CHECKUP = text("""
+    UPDATE silver.committee_personal_checkup
+    SET end_date = :start_date, is_current = FALSE
+    WHERE member_id = :member_id 
+    AND is_current = TRUE
+""")
+
+_SQL_GET_CURRENT_PERSONAL_DESCRIPTION = text("""
+    SELECT personal_description
+    FROM silver.committee_personal_checkup
+    WHERE member_id = :member_id AND is_current = TRUE
+    LIMIT 1
+""")
+
+_SQL_INSERT_CHECKUP = text("""
+    INSERT INTO silver.committee_personal_checkup 
+    (member_id, committee_name, personal_description, checkup_text, start_date, end_date, is_current)
+    VALUES (:member_id, :committee_name, :personal_description, :checkup_text, :start_date, '9999-12-31', TRUE)
+""")
 
 
 def set_committee_personal_checkup(
@@ -173,16 +226,11 @@ def set_committee_personal_checkup(
     engine = DatabaseEngine.get_engine()
 
     # First, find the member_id for the given discord_id
-    committee_query = text("""
-        SELECT member_id, name
-        FROM silver.committee
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
-
     with engine.begin() as conn:
         # Get committee info
-        committee_result = conn.execute(committee_query, {"discord_id": discord_id})
+        committee_result = conn.execute(
+            _SQL_GET_COMMITTEE_MEMBER_ID, {"discord_id": discord_id}
+        )
         committee = committee_result.fetchone()
 
         if not committee:
@@ -192,27 +240,13 @@ def set_committee_personal_checkup(
         committee_name = committee.name
 
         # End the current active record (if it exists)
-        end_current_query = text("""
-            UPDATE silver.committee_personal_checkup
-            SET end_date = :start_date, is_current = FALSE
-            WHERE member_id = :member_id 
-            AND is_current = TRUE
-        """)
-
         end_result = conn.execute(
-            end_current_query, {"member_id": member_id, "start_date": start_date}
+            _SQL_END_CURRENT_CHECKUP, {"member_id": member_id, "start_date": start_date}
         )
 
         # Get the personal_description from the current active record (if it exists)
-        personal_desc_query = text("""
-            SELECT personal_description
-            FROM silver.committee_personal_checkup
-            WHERE member_id = :member_id AND is_current = TRUE
-            LIMIT 1
-        """)
-
         personal_desc_result = conn.execute(
-            personal_desc_query, {"member_id": member_id}
+            _SQL_GET_CURRENT_PERSONAL_DESCRIPTION, {"member_id": member_id}
         )
         personal_desc_row = personal_desc_result.fetchone()
         personal_description = (
@@ -220,14 +254,8 @@ def set_committee_personal_checkup(
         )
 
         # Insert the new checkup record
-        insert_query = text("""
-            INSERT INTO silver.committee_personal_checkup 
-            (member_id, committee_name, personal_description, checkup_text, start_date, end_date, is_current)
-            VALUES (:member_id, :committee_name, :personal_description, :checkup_text, :start_date, '9999-12-31', TRUE)
-        """)
-
         conn.execute(
-            insert_query,
+            _SQL_INSERT_CHECKUP,
             {
                 "member_id": member_id,
                 "committee_name": committee_name,
@@ -237,13 +265,28 @@ def set_committee_personal_checkup(
             },
         )
 
-        print(
-            f"✅ Added checkup for committee member {committee_name} (ID: {member_id})"
+        logger.info(
+            f"Added checkup for committee member {committee_name} (ID: {member_id})"
         )
         if end_result.rowcount > 0:
-            print(f"   Ended previous active record and created new one")
+            logger.debug("Ended previous active record and created new one")
         else:
-            print(f"   Created first checkup record for this member")
+            logger.debug("Created first checkup record for this member")
+
+
+_SQL_GET_LATEST_CHECKUP = text("""
+    SELECT c.name, cpc.member_id AS checkup_member_id,
+           cpc.personal_description, cpc.checkup_text, cpc.start_date
+    FROM (
+        SELECT member_id, name
+        FROM silver.committee
+        WHERE discord_id = :discord_id
+        LIMIT 1
+    ) c
+    LEFT JOIN silver.committee_personal_checkup cpc ON cpc.member_id = c.member_id
+    ORDER BY cpc.is_current DESC, cpc.start_date DESC
+    LIMIT 1
+""")
 
 
 def get_latest_personal_checkup(discord_id: str) -> str:
@@ -252,28 +295,16 @@ def get_latest_personal_checkup(discord_id: str) -> str:
     Returns a formatted string with the personal description and latest checkup for LLM consumption.
     """
     engine = DatabaseEngine.get_engine()
-    committee_query = text("""
-        SELECT member_id, name
-        FROM silver.committee
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
+    # Committee member and latest checkup in one round-trip; checkup columns are
+    # NULL when the member has no checkup records
     with engine.connect() as conn:
-        committee_result = conn.execute(committee_query, {"discord_id": discord_id})
-        committee = committee_result.fetchone()
-        if not committee:
-            return f"No committee member found for discord_id {discord_id}."
-        member_id = committee.member_id
-        committee_name = committee.name
-        checkup_query = text("""
-            SELECT personal_description, checkup_text, start_date
-            FROM silver.committee_personal_checkup
-            WHERE member_id = :member_id
-            ORDER BY is_current DESC, start_date DESC
-            LIMIT 1
-        """)
-        checkup = conn.execute(checkup_query, {"member_id": member_id}).fetchone()
+        checkup = conn.execute(
+            _SQL_GET_LATEST_CHECKUP, {"discord_id": discord_id}
+        ).fetchone()
         if not checkup:
+            return f"No committee member found for discord_id {discord_id}."
+        committee_name = checkup.name
+        if checkup.checkup_member_id is None:
             return f"No checkup records found for committee member '{committee_name}'."
         personal_desc = checkup.personal_description or "(No personal description)"
         checkup_text = checkup.checkup_text or "(No checkup text)"
@@ -290,6 +321,34 @@ def get_latest_personal_checkup(discord_id: str) -> str:
         )
 
 
+_SQL_GET_CHECKUPS_AS_OF = text("""
+    SELECT c.name, cpc.member_id AS checkup_member_id,
+           cpc.personal_description, cpc.checkup_text, cpc.start_date
+    FROM (
+        SELECT member_id, name
+        FROM silver.committee
+        WHERE discord_id = :discord_id
+        LIMIT 1
+    ) c
+    LEFT JOIN silver.committee_personal_checkup cpc
+        ON cpc.member_id = c.member_id AND cpc.start_date <= :as_of
+    ORDER BY cpc.start_date DESC
+""")
+
+_SQL_GET_CHECKUPS = text("""
+    SELECT c.name, cpc.member_id AS checkup_member_id,
+           cpc.personal_description, cpc.checkup_text, cpc.start_date
+    FROM (
+        SELECT member_id, name
+        FROM silver.committee
+        WHERE discord_id = :discord_id
+        LIMIT 1
+    ) c
+    LEFT JOIN silver.committee_personal_checkup cpc ON cpc.member_id = c.member_id
+    ORDER BY cpc.start_date DESC
+""")
+
+
 def get_checkups_for_discord_id(
     discord_id: str, as_of: Optional[datetime] = None
 ) -> dict[str, Any]:
@@ -298,37 +357,21 @@ def get_checkups_for_discord_id(
     Returns a dictionary with the latest personal description and all relevant checkups with their dates.
     """
     engine = DatabaseEngine.get_engine()
-    committee_query = text("""
-        SELECT member_id, name
-        FROM silver.committee
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
+    # Committee member and checkups in one round-trip; a member without checkups
+    # comes back as a single row with NULL checkup columns
     with engine.connect() as conn:
-        committee_result = conn.execute(committee_query, {"discord_id": discord_id})
-        committee = committee_result.fetchone()
-        if not committee:
-            return {"error": f"No committee member found for discord_id {discord_id}."}
-        member_id = committee.member_id
-        committee_name = committee.name
         if as_of:
-            checkup_query = text("""
-                SELECT personal_description, checkup_text, start_date
-                FROM silver.committee_personal_checkup
-                WHERE member_id = :member_id AND start_date <= :as_of
-                ORDER BY start_date DESC
-            """)
-            checkups = conn.execute(
-                checkup_query, {"member_id": member_id, "as_of": as_of}
+            rows = conn.execute(
+                _SQL_GET_CHECKUPS_AS_OF, {"discord_id": discord_id, "as_of": as_of}
             ).fetchall()
         else:
-            checkup_query = text("""
-                SELECT personal_description, checkup_text, start_date
-                FROM silver.committee_personal_checkup
-                WHERE member_id = :member_id
-                ORDER BY start_date DESC
-            """)
-            checkups = conn.execute(checkup_query, {"member_id": member_id}).fetchall()
+            rows = conn.execute(
+                _SQL_GET_CHECKUPS, {"discord_id": discord_id}
+            ).fetchall()
+        if not rows:
+            return {"error": f"No committee member found for discord_id {discord_id}."}
+        committee_name = rows[0].name
+        checkups = [row for row in rows if row.checkup_member_id is not None]
         if not checkups:
             return {
                 "committee_member": committee_name,
@@ -348,7 +391,7 @@ def get_checkups_for_discord_id(
                 else "(No date)"
             )
             checkup_text = checkup.checkup_text or "(No checkup text)"
-            checkup_list.append({"date": date_str, "text": checkup_text}) # type: ignore
+            checkup_list.append({"date": date_str, "text": checkup_text})  # type: ignore
 
         return {
             "committee_member": committee_name,
@@ -360,41 +403,48 @@ def get_checkups_for_discord_id(
         }
 
 
+_SQL_GET_PERSONAL_DESCRIPTION = text("""
+    SELECT cpc.member_id AS checkup_member_id, cpc.personal_description
+    FROM (
+        SELECT member_id
+        FROM silver.committee
+        WHERE discord_id = :discord_id
+        LIMIT 1
+    ) c
+    LEFT JOIN silver.committee_personal_checkup cpc ON cpc.member_id = c.member_id
+    ORDER BY cpc.is_current DESC, cpc.start_date DESC
+    LIMIT 1
+""")
+
+
 def get_current_personal_description(discord_id: str) -> str:
     """
     Fetch the current personal description for a given discord_id.
     Returns the personal description from the most recent checkup record.
     """
     engine = DatabaseEngine.get_engine()
-    committee_query = text("""
-        SELECT member_id, name
-        FROM silver.committee
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
+    # Committee member and latest checkup in one round-trip
     with engine.connect() as conn:
-        committee_result = conn.execute(committee_query, {"discord_id": discord_id})
-        committee = committee_result.fetchone()
-        if not committee:
+        checkup = conn.execute(
+            _SQL_GET_PERSONAL_DESCRIPTION, {"discord_id": discord_id}
+        ).fetchone()
+        if not checkup:
             return f"No committee member found for discord_id {discord_id}."
 
-        member_id = committee.member_id
-
-        checkup_query = text("""
-            SELECT personal_description
-            FROM silver.committee_personal_checkup
-            WHERE member_id = :member_id
-            ORDER BY is_current DESC, start_date DESC
-            LIMIT 1
-        """)
-        checkup = conn.execute(checkup_query, {"member_id": member_id}).fetchone()
-
-        if not checkup:
+        if checkup.checkup_member_id is None:
             return "(No personal description available)"
 
         return checkup.personal_description or "(No personal description)"
 
 
+_SQL_UPDATE_PERSONAL_DESCRIPTION = text("""
+    UPDATE silver.committee_personal_checkup
+    SET personal_description = :personal_description
+    WHERE member_id = :member_id 
+    AND is_current = TRUE
+""")
+
+
 def set_personal_description(discord_id: str, personal_description: str) -> None:
     """
     Update the personal_description of the latest (active) row for a given discord_id.
@@ -407,16 +457,11 @@ def set_personal_description(discord_id: str, personal_description: str) -> None
     engine = DatabaseEngine.get_engine()
 
     # First, find the member_id for the given discord_id
-    committee_query = text("""
-        SELECT member_id, name
-        FROM silver.committee
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
-
     with engine.begin() as conn:
         # Get committee info
-        committee_result = conn.execute(committee_query, {"discord_id": discord_id})
+        committee_result = conn.execute(
+            _SQL_GET_COMMITTEE_MEMBER_ID, {"discord_id": discord_id}
+        )
         committee = committee_result.fetchone()
 
         if not committee:
@@ -426,15 +471,8 @@ def set_personal_description(discord_id: str, personal_description: str) -> None
         committee_name = committee.name
 
         # Update the personal_description of the current active record
-        update_query = text("""
-            UPDATE silver.committee_personal_checkup
-            SET personal_description = :personal_description
-            WHERE member_id = :member_id 
-            AND is_current = TRUE
-        """)
-
         result = conn.execute(
-            update_query,
+            _SQL_UPDATE_PERSONAL_DESCRIPTION,
             {"member_id": member_id, "personal_description": personal_description},
         )
 
@@ -443,10 +481,18 @@ def set_personal_description(discord_id: str, personal_description: str) -> None
                 f"No active checkup record found for committee member {committee_name}"
             )
 
-        print(
-            f"✅ Updated personal description for committee member {committee_name} (ID: {member_id})"
+        logger.info(
+            f"Updated personal description for committee member {committee_name} (ID: {member_id})"
         )
-        print(f"   New description: {personal_description}")
+        logger.debug(f"New description: {personal_description}")
+
+
+_SQL_GET_COMMITTEE_MEMBER_BY_NOTION_ID = text("""
+    SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
+    FROM silver.committee
+    WHERE notion_id = :notion_id
+    LIMIT 1
+""")
 
 
 def get_committee_member_by_notion_id(notion_id: str) -> Optional[dict[str, Any]]:
@@ -460,18 +506,22 @@ def get_committee_member_by_notion_id(notion_id: str) -> Optional[dict[str, Any]
         Dictionary containing member data or None if not found
     """
     engine = DatabaseEngine.get_engine()
-    query = text("""
-        SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
-        FROM silver.committee
-        WHERE notion_id = :notion_id
-        LIMIT 1
-    """)
     with engine.connect() as conn:
-        result = conn.execute(query, {"notion_id": notion_id})
+        result = conn.execute(
+            _SQL_GET_COMMITTEE_MEMBER_BY_NOTION_ID, {"notion_id": notion_id}
+        )
         member = result.mappings().first()
         return dict(member) if member else None
 
 
+_SQL_GET_COMMITTEE_MEMBER_BY_DISCORD_ID = text("""
+    SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
+    FROM silver.committee
+    WHERE discord_id = :discord_id
+    LIMIT 1
+""")
+
+
 def get_committee_member_by_discord_id(discord_id: str) -> Optional[dict[str, Any]]:
     """
     Retrieve a committee member by their Discord ID.
@@ -483,18 +533,22 @@ def get_committee_member_by_discord_id(discord_id: str) -> Optional[dict[str, An
         Dictionary containing member data or None if not found
     """
     engine = DatabaseEngine.get_engine()
-    query = text("""
-        SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
-        FROM silver.committee
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
     with engine.connect() as conn:
-        result = conn.execute(query, {"discord_id": discord_id})
+        result = conn.execute(
+            _SQL_GET_COMMITTEE_MEMBER_BY_DISCORD_ID, {"discord_id": discord_id}
+        )
         member = result.mappings().first()
         return dict(member) if member else None
 
 
+_SQL_GET_COMMITTEE_MEMBER_BY_DM_CHANNEL_ID = text("""
+    SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
+    FROM silver.committee
+    WHERE discord_dm_channel_id = :discord_dm_channel_id
+    LIMIT 1
+""")
+
+
 def get_committee_member_by_discord_dm_channel_id(
     discord_dm_channel_id: int,
 ) -> Optional[dict[str, Any]]:
@@ -508,14 +562,11 @@ def get_committee_member_by_discord_dm_channel_id(
         Dictionary containing member data or None if not found
     """
     engine = DatabaseEngine.get_engine()
-    query = text("""
-        SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
-        FROM silver.committee
-        WHERE discord_dm_channel_id = :discord_dm_channel_id
-        LIMIT 1
-    """)
     with engine.connect() as conn:
-        result = conn.execute(query, {"discord_dm_channel_id": discord_dm_channel_id})
+        result = conn.execute(
+            _SQL_GET_COMMITTEE_MEMBER_BY_DM_CHANNEL_ID,
+            {"discord_dm_channel_id": discord_dm_channel_id},
+        )
         member = result.mappings().first()
         return dict(member) if member else None
 
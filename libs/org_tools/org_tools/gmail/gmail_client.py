@@ -1,16 +1,10 @@
 import base64
 import os
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Any, Optional
 
-
-# there are no types for googleapis bruh
-from google.auth.transport.requests import Request  # type: ignore
-from google.oauth2.credentials import Credentials  # type: ignore
-from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
-from googleapiclient.discovery import build  # type: ignore
-
 SCOPES = [
     "https://www.googleapis.com/auth/gmail.send",
     "https://www.googleapis.com/auth/gmail.readonly",
@@ -22,10 +16,25 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CLIENT_SECRET_PATH = os.path.join(SCRIPT_DIR, "secrets/client_secret.json")
 TOKEN_PATH = os.path.join(SCRIPT_DIR, "secrets/token.json")
 
+# Authenticated service per thread (the underlying httplib2.Http is not thread-safe)
+_thread_local = threading.local()
+
 
 def __authenticate() -> Any:
     
     """Authenticate with Gmail API using OAuth2."""
+    # Reuse the service built earlier on this thread
+    service: Any = getattr(_thread_local, "service", None)
+    if service is not None:
+        return service
+
+    # Imported here so importing this module stays cheap until Gmail is used
+    # there are no types for googleapis bruh
+    from google.auth.transport.requests import Request  # type: ignore
+    from google.oauth2.credentials import Credentials  # type: ignore
+    from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
+    from googleapiclient.discovery import build  # type: ignore
+
     # Check if token.json exists
     if os.path.exists(TOKEN_PATH):
         creds : Credentials = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)  # type: ignore
@@ -45,7 +54,8 @@ def __authenticate() -> Any:
             with open(TOKEN_PATH, "w") as token:
                 token.write(creds.to_json())
 
-    service: Any = build("gmail", "v1", credentials=creds)  # type: ignore
+    service = build("gmail", "v1", credentials=creds)  # type: ignore
+    _thread_local.service = service
     return service
 
 